@@ -1,14 +1,13 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from smolagents import CodeAgent, OpenAIServerModel
+from typing import TYPE_CHECKING
 import config
-from tools.eda_tools import get_dataframe_info, save_figure, create_report, ensure_directory
-from tools.vision_tools import analyze_image
 import io
 from memory import Memory  # Import your custom memory manager
 
+# pandas, matplotlib, seaborn and smolagents are imported where they are used so that
+# importing this module (e.g. from the daemon client or `main.py --help`) stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
+
 SYSTEM_PROMPT = """
 You are an exploratory data analysis (EDA) assistant powered by smolagents.
 Guidelines:
@@ -93,8 +92,41 @@ NOTE: You can look at visualizations paths list using state['visualization_paths
 IMPORTANT: After saving any visualization using save_figure, ALWAYS add the returned path to state['visualization_paths'] list to keep track of all generated visualizations.
 """
 
+def describe_step(step) -> dict:
+    """Convert a streamed smolagents step into a JSON-serializable message, or None to skip it."""
+    if type(step).__name__ == "FinalAnswerStep":
+        return {"type": "result", "content": str(getattr(step, "output", step))}
+    if type(step).__name__ == "PlanningStep":
+        return {"type": "plan", "content": step.plan}
+    if not hasattr(step, "step_number"):
+        return None
+    error = getattr(step, "error", None)
+    return {
+        "type": "step",
+        "step": step.step_number,
+        "code": getattr(step, "code_action", None),
+        "observations": getattr(step, "observations", None),
+        "error": str(error) if error else None,
+    }
+
+def eda_tools() -> list:
+    """The tools given to the agent; the execution kernel resolves tool names against this list."""
+    from tools.eda_tools import get_dataframe_info, save_figure, create_report, ensure_directory
+    from tools.vision_tools import analyze_image
+
+    return [
+        get_dataframe_info,
+        save_figure,
+        create_report,
+        ensure_directory,
+        analyze_image
+    ]
+
 class EDAAgent:
-    def __init__(self, dataframe: pd.DataFrame):
+    def __init__(self, dataframe: "pd.DataFrame", use_kernel: bool = config.USE_KERNEL, verbose: bool = True):
+        import matplotlib.pyplot as plt
+        from smolagents import CodeAgent, LogLevel, OpenAIServerModel
+
         self.df = dataframe
         
         # Set plot style
@@ -109,39 +141,45 @@ class EDAAgent:
         )
         
         # Create tools list (without execute_analysis)
-        self.tools = [
-            get_dataframe_info,
-            save_figure,
-            create_report,
-            ensure_directory,
-            analyze_image
-        ]
+        self.tools = eda_tools()
         
         # Initialize persistent memory using our Memory class
         self.memory = Memory()
         
+        authorized_imports = [
+            "pandas",
+            "numpy",
+            "matplotlib.pyplot",
+            "seaborn",
+            "io"
+        ]
+
         # Initialize CodeAgent
         self.agent = CodeAgent(
             tools=self.tools,
             model=self.model,
             max_steps=config.MAX_STEPS,
             planning_interval=config.PLANNING_INTERVAL,
-            additional_authorized_imports=[
-                "pandas",
-                "numpy",
-                "matplotlib.pyplot",
-                "seaborn",
-                "io"
-            ]
+            additional_authorized_imports=authorized_imports,
+            # Callers that stream the steps themselves turn smolagents' console log off
+            verbosity_level=LogLevel.INFO if verbose else LogLevel.OFF
         )
 
-    def run(self, query: str = None, reset: bool = False):
+        # Optionally run generated code in a persistent worker process that keeps the DataFrame resident
+        self.use_kernel = use_kernel
+        if use_kernel:
+            from tools.python_exec import KernelPythonExecutor
+            self.agent.python_executor = KernelPythonExecutor(self.df, authorized_imports)
+
+    def run(self, query: str = None, reset: bool = False, stream: bool = False):
         """
         Run the EDA process based on a user query or default analysis.
         
         Args:
             query: Optional user query for specific analysis.
             reset: If False, the agent retains its previous memory and context.
+            stream: If True, return a generator yielding each agent step as it completes
+                (the last item is the final answer step) instead of the final result.
         """
         if query is None:
             query = (
@@ -149,38 +187,101 @@ class EDAAgent:
                 "Start with basic statistics and create relevant visualizations for numeric columns."
             )
         
-        # Create execution context with DataFrame, libraries, and persistent memory
+        if self.df is None:
+            raise ValueError("DataFrame not initialized in execution context")
+
+        # Create execution context with DataFrame, libraries, and persistent memory.
+        # The kernel already holds the DataFrame and libraries, so only the rest is sent.
         execution_context = {
-            "df": self.df.copy(),
             "visualization_paths": [],
-            "pd": pd,
-            "np": np,
-            "plt": plt,
-            "sns": sns,
-            "io": io,
             "memory": self.memory.get_history()
         }
-        
-        if execution_context["df"] is None:
-            raise ValueError("DataFrame not initialized in execution context")
+        if not self.use_kernel:
+            import pandas as pd
+            import numpy as np
+            import matplotlib.pyplot as plt
+            import seaborn as sns
+
+            execution_context.update({
+                "df": self.df.copy(),
+                "pd": pd,
+                "np": np,
+                "plt": plt,
+                "sns": sns,
+                "io": io,
+            })
+
+        # Exposed so callers streaming a run can follow e.g. the generated visualization paths
+        self.current_state = execution_context
+
+        additional_args = {
+            "state": execution_context,
+            "system_prompt": SYSTEM_PROMPT
+        }
+
+        if stream:
+            return self._run_stream(query, reset, additional_args)
+
+        # Only steps added by this run are recorded; a reset run starts from an empty agent memory
+        start = 0 if reset else len(self._agent_steps())
 
         # Run the agent; by setting reset=False, the agent builds on previous memory
-        result = self.agent.run(
-            task=query,
-            reset=reset,
-            additional_args={
-                "state": execution_context,
-                "system_prompt": SYSTEM_PROMPT
-            }
-        )
-        
-        # Optionally, update our persistent memory with new logs from the agent's run
-        # (Here we simply append all new log messages; you could also filter or summarize them.)
-        for log in self.agent.logs:
-            self.memory.add(str(log))
-        
+        result = self.agent.run(task=query, reset=reset, additional_args=additional_args)
+        self._record_logs(query, start)
         return result
 
+    def interrupt(self, kill_step: bool = False):
+        """
+        Stop the current run. The agent stops before its next step; conversation memory is kept.
+
+        Args:
+            kill_step: With the execution kernel, also kill the running code step. This restarts
+                the kernel, which resets state['df'] and loses the variables from earlier steps.
+        """
+        self.agent.interrupt()
+        if self.use_kernel and kill_step:
+            self.agent.python_executor.interrupt()
+
+    def close(self):
+        """Release resources held by the agent, such as the execution kernel."""
+        if self.use_kernel:
+            self.agent.python_executor.cleanup()
+
+    def _run_stream(self, query: str, reset: bool, additional_args: dict):
+        """Yield agent steps as they are produced, then record the run in memory."""
+        start = 0 if reset else len(self._agent_steps())
+        try:
+            yield from self.agent.run(task=query, reset=reset, stream=True, additional_args=additional_args)
+        finally:
+            self._record_logs(query, start)
+
+    def _agent_steps(self):
+        # Newer smolagents releases expose the steps as memory.steps instead of logs.
+        logs = getattr(self.agent, "logs", None)
+        return logs if logs is not None else self.agent.memory.steps
+
+    def _record_logs(self, query: str, start: int):
+        # Update our persistent memory with the steps added by this run. Only a compact form
+        # (code, observations, errors, final answer) is kept: the step reprs include the full
+        # model input, and the history is fed back into the next task through state['memory'].
+        self.memory.add(f"Task: {query}")
+        for step in self._agent_steps()[start:]:
+            code = getattr(step, "code_action", None)
+            observations = getattr(step, "observations", None)
+            error = getattr(step, "error", None)
+            if code is None and observations is None and error is None:
+                continue
+            entry = [f"Step {getattr(step, 'step_number', '?')}:"]
+            if code:
+                entry.append(f"Code:\n{code}")
+            if observations:
+                entry.append(f"Observations:\n{observations}")
+            if error:
+                entry.append(f"Error: {error}")
+            if getattr(step, "is_final_answer", False):
+                entry.append(f"Final answer: {getattr(step, 'action_output', None)}")
+            self.memory.add("\n".join(entry))
+
     def ask(self, query: str):
         """
         Ask the agent to perform a specific analysis.
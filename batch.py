@@ -0,0 +1,221 @@
+"""
+Batch EDA over a directory or glob of datasets.
+
+Datasets go through two stages, each with its own worker pool: a CPU stage
+(load, profile, render baseline plots) and an LLM stage (agent analysis and
+report). Worker processes are reused across datasets so libraries are imported
+once per worker. A checkpoint manifest is written after every completed stage,
+so an interrupted batch resumes where it stopped.
+"""
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import config
+from tools.file_io import file_fingerprint
+
+SUPPORTED_EXTENSIONS = (".csv", ".parquet")
+
+
+def discover_datasets(pattern: str) -> list:
+    """Return the supported dataset files under a directory (recursively) or matching a glob pattern."""
+    if os.path.isdir(pattern):
+        # Recurse so Hive-style partition directories (e.g. year=2024/part-0.parquet) are found
+        pattern = os.path.join(pattern, "**", "*")
+    return sorted(p for p in glob.glob(pattern, recursive=True)
+                  if os.path.isfile(p) and p.endswith(SUPPORTED_EXTENSIONS))
+
+
+def dataset_output_dir(path: str, output_root: str) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:8]
+    # The agent writes to a relative 'output/' directory, so each dataset gets its own working
+    # directory and its outputs live in the 'output/' folder inside it.
+    return os.path.join(os.path.abspath(output_root), f"{stem}-{digest}", "output")
+
+
+def load_manifest(manifest_path: str) -> dict:
+    if not os.path.exists(manifest_path):
+        return {"datasets": {}}
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: dict, manifest_path: str):
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def profile_dataset(path: str, output_dir: str) -> dict:
+    """
+    CPU stage: load the dataset, write a text profile and render baseline plots.
+
+    Runs in a worker process. Returns the row/column counts, generated plot paths and timing.
+    """
+    from tools.column_stats import new_column_stats
+    from tools.eda_tools import get_dataframe_info
+    from tools.file_io import load_dataset
+    from tools.plotting import plot_filename
+
+    start = time.perf_counter()
+    df = load_dataset(path)
+    visualization_dir = os.path.join(output_dir, "visualizations")
+    os.makedirs(visualization_dir, exist_ok=True)
+
+    with open(os.path.join(output_dir, "profile.txt"), "w") as f:
+        f.write(get_dataframe_info(df=df))
+
+    plots = []
+    for column in df.columns:
+        name = str(column)
+        stats = new_column_stats(df[column])
+        stats.update(df[column])
+        if stats.count == 0 or getattr(stats, "high_cardinality", False):
+            continue
+        plot_path = os.path.join(visualization_dir, plot_filename(name, stats.kind))
+        with open(plot_path, "wb") as f:
+            f.write(stats.render(name).getvalue())
+        plots.append(plot_path)
+
+    return {"rows": len(df), "columns": len(df.columns), "plots": plots,
+            "profile_seconds": time.perf_counter() - start}
+
+
+def analyze_dataset(path: str, output_dir: str) -> dict:
+    """
+    LLM stage: run the EDA agent on the dataset and write its report into `output_dir`.
+
+    Runs in a worker process so concurrent agents do not share matplotlib state. The worker
+    changes into the parent of `output_dir`, so the 'output/' paths used by the agent prompt
+    resolve to this dataset's directory and concurrent agents never share a report.
+    """
+    from agent import EDAAgent
+    from tools.file_io import load_dataset
+
+    start = time.perf_counter()
+    df = load_dataset(path)
+    os.chdir(os.path.dirname(output_dir))
+    agent = EDAAgent(dataframe=df)
+    query = (
+        f"Please perform an exploratory data analysis on the dataset '{os.path.basename(path)}'. "
+        "Baseline per-column plots are already in 'output/visualizations' and a profile is in "
+        "'output/profile.txt'."
+    )
+    try:
+        result = agent.run(query, reset=True)
+    except Exception as e:
+        # Client library exceptions (e.g. openai's) may not unpickle in the parent,
+        # which would break the whole pool instead of failing this dataset.
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+    finally:
+        agent.close()
+    return {"result": str(result), "analyze_seconds": time.perf_counter() - start}
+
+
+def run_batch(pattern: str, output_root: str = config.BATCH_OUTPUT_DIR,
+              cpu_workers: int = config.BATCH_CPU_WORKERS,
+              llm_workers: int = config.BATCH_LLM_WORKERS) -> dict:
+    """
+    Profile and analyze every dataset matching `pattern`, resuming from the checkpoint manifest.
+
+    Args:
+        pattern: A directory or glob pattern of CSV/Parquet files.
+        output_root: Directory for per-dataset outputs, the manifest and the summary.
+        cpu_workers: Number of processes for the load/profile/render stage.
+        llm_workers: Number of concurrent agent runs. 0 skips the LLM stage.
+
+    Returns:
+        The throughput summary, also written to `<output_root>/summary.json`.
+    """
+    os.makedirs(output_root, exist_ok=True)
+    manifest_path = os.path.join(output_root, "manifest.json")
+    manifest = load_manifest(manifest_path)
+    entries = manifest["datasets"]
+    final_status = "done" if llm_workers > 0 else "profiled"
+
+    datasets = discover_datasets(pattern)
+    to_profile, to_analyze, skipped = [], [], 0
+    for path in datasets:
+        entry = entries.get(path)
+        if entry is None or entry["fingerprint"] != file_fingerprint(path) or entry["status"] == "failed":
+            entries[path] = {"fingerprint": file_fingerprint(path), "status": "pending",
+                             "output_dir": dataset_output_dir(path, output_root)}
+            to_profile.append(path)
+        elif entry["status"] == "pending":
+            to_profile.append(path)
+        elif entry["status"] == "profiled" and final_status == "done":
+            to_analyze.append(path)
+        else:
+            skipped += 1
+    save_manifest(manifest, manifest_path)
+
+    start = time.perf_counter()
+    processed = failed = rows = 0
+    cpu_pool = ProcessPoolExecutor(max_workers=max(1, cpu_workers))
+    llm_pool = ProcessPoolExecutor(max_workers=llm_workers) if llm_workers > 0 else None
+    pending = {}
+
+    def submit_analysis(path):
+        future = llm_pool.submit(analyze_dataset, os.path.abspath(path), entries[path]["output_dir"])
+        pending[future] = ("analyze", path)
+
+    try:
+        for path in to_profile:
+            os.makedirs(entries[path]["output_dir"], exist_ok=True)
+            future = cpu_pool.submit(profile_dataset, path, entries[path]["output_dir"])
+            pending[future] = ("profile", path)
+        for path in to_analyze:
+            submit_analysis(path)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, path = pending.pop(future)
+                entry = entries[path]
+                try:
+                    entry.update(future.result())
+                except Exception as e:
+                    entry.update({"status": "failed", "error": f"{stage}: {e}"})
+                    failed += 1
+                    print(f"[batch] {path} failed during {stage}: {e}")
+                else:
+                    if stage == "profile":
+                        rows += entry["rows"]
+                    entry["status"] = "profiled" if stage == "profile" else "done"
+                    if entry["status"] == "profiled" and llm_pool is not None:
+                        submit_analysis(path)
+                    elif entry["status"] == final_status:
+                        processed += 1
+                        print(f"[batch] {path} -> {entry['output_dir']}")
+                save_manifest(manifest, manifest_path)
+    finally:
+        cpu_pool.shutdown(cancel_futures=True)
+        if llm_pool is not None:
+            llm_pool.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    finished = [entries[p] for p in datasets if entries[p]["status"] == final_status]
+    summary = {
+        "datasets_total": len(datasets),
+        "processed": processed,
+        "skipped_from_checkpoint": skipped,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 2),
+        "datasets_per_second": round(processed / elapsed, 3) if elapsed else None,
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+        "mean_profile_seconds": _mean(e.get("profile_seconds") for e in finished),
+        "mean_analyze_seconds": _mean(e.get("analyze_seconds") for e in finished),
+    }
+    with open(os.path.join(output_root, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return round(sum(values) / len(values), 3) if values else None
@@ -0,0 +1,84 @@
+"""
+Thin client for the EDA daemon (see daemon.py).
+
+Only uses the standard library so it starts in milliseconds; all the heavy
+lifting happens in the already-warm daemon process.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+
+# Kept in sync with config.DAEMON_SOCKET_PATH; config is not imported to keep startup cheap.
+DEFAULT_SOCKET_PATH = os.getenv("EDA_DAEMON_SOCKET", "/tmp/eda_agent.sock")
+
+
+def send_request(request: dict, socket_path: str = DEFAULT_SOCKET_PATH):
+    """Send a request to the daemon and yield its response messages as they arrive."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile("r") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+def print_message(message: dict):
+    if message["type"] == "step":
+        print(f"\n--- Step {message['step']} ---")
+        if message.get("code"):
+            print(message["code"])
+        if message.get("observations"):
+            print(message["observations"])
+        if message.get("error"):
+            print(f"Error: {message['error']}")
+    elif message["type"] == "plan":
+        print("\n--- Plan ---")
+        print(message["content"])
+    elif message["type"] == "result":
+        content = message["content"]
+        print("\nAgent Response:")
+        print(content if isinstance(content, str) else json.dumps(content, indent=2))
+    elif message["type"] == "error":
+        print(f"\nError: {message['content']}", file=sys.stderr)
+    else:
+        print(f"[{message['content']}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send a query to the running EDA daemon")
+    parser.add_argument("query", nargs="?", help="Analysis request for the agent")
+    parser.add_argument("--path", type=str, help="Path to the dataset (CSV/Parquet)")
+    parser.add_argument("--session", type=str, default="default", help="Agent session to continue")
+    parser.add_argument("--reset", action="store_true", help="Start the session from a clean memory")
+    parser.add_argument("--socket", type=str, default=DEFAULT_SOCKET_PATH, help="Daemon socket path")
+    parser.add_argument("--status", action="store_true", help="Show cached datasets and sessions")
+    parser.add_argument("--evict", action="store_true", help="Drop the cached dataset and its sessions")
+    parser.add_argument("--shutdown", action="store_true", help="Stop the daemon")
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.path) if args.path else None
+    if args.status:
+        request = {"action": "status"}
+    elif args.shutdown:
+        request = {"action": "shutdown"}
+    elif args.evict:
+        if path is None:
+            parser.error("--path is required to evict a dataset")
+        request = {"action": "evict", "path": path}
+    else:
+        if path is None:
+            parser.error("--path is required to ask a question")
+        request = {"action": "ask", "path": path, "query": args.query,
+                   "session": args.session, "reset": args.reset}
+
+    failed = False
+    for message in send_request(request, args.socket):
+        print_message(message)
+        failed = failed or message["type"] == "error"
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,3 +16,24 @@ PLANNING_INTERVAL = 3
 PLOT_STYLE = "default"
 FIGURE_SIZE = (12, 8)
 DPI = 150
+
+# Incremental re-analysis settings
+INCREMENTAL_STATE_PATH = "output/incremental_state.json"
+HISTOGRAM_BINS = 30
+MAX_TRACKED_CATEGORIES = 50  # Stop tracking category counts for high-cardinality columns
+MATERIAL_CHANGE_THRESHOLD = 0.05  # Total variation distance that triggers a re-render
+
+# Batch mode settings
+BATCH_OUTPUT_DIR = "output/batch"
+BATCH_CPU_WORKERS = os.cpu_count() or 1  # Load/profile/render processes
+BATCH_LLM_WORKERS = 2  # Concurrent agent runs; 0 disables the LLM stage
+
+# Daemon settings (client.py reads the same environment variable without importing this module)
+DAEMON_SOCKET_PATH = os.getenv("EDA_DAEMON_SOCKET", "/tmp/eda_agent.sock")
+
+# Out-of-process execution kernel settings
+USE_KERNEL = False  # Run agent code in a persistent worker process (requires pyarrow)
+KERNEL_STEP_TIMEOUT = 300  # Wall-clock seconds per code step
+KERNEL_STEP_CPU_SECONDS = 300
+KERNEL_STEP_MEMORY_MB = 4096  # Additional address space a single step may allocate
+KERNEL_HANDLE_THRESHOLD_BYTES = 1_000_000  # Larger step outputs stay in the kernel as handles
@@ -0,0 +1,168 @@
+"""
+Long-lived local EDA daemon.
+
+Keeps the heavy libraries imported, loaded DataFrames cached and `EDAAgent`
+sessions warm, and serves queries over a Unix socket. Use `client.py` to talk
+to it.
+
+Protocol: the client sends one JSON object per connection on a single line,
+e.g. {"action": "ask", "path": "/abs/data.csv", "query": "...", "session": "default"}.
+The daemon answers with newline-delimited JSON messages of type "status",
+"plan", "step", "result" or "error". Other actions: "status", "evict" and "shutdown".
+"""
+import argparse
+import json
+import os
+import socketserver
+import threading
+
+import config
+
+_frames = {}  # path -> (fingerprint, DataFrame)
+_agents = {}  # (path, session) -> (fingerprint, EDAAgent)
+_cache_lock = threading.Lock()
+# pyplot keeps global figure state, so agent runs are serialized across sessions.
+_run_lock = threading.Lock()
+
+
+def get_dataframe(path: str):
+    """Return the cached (fingerprint, DataFrame) for `path`, reloading it if the file changed."""
+    from tools.file_io import file_fingerprint, load_dataset
+
+    fingerprint = file_fingerprint(path)
+    with _cache_lock:
+        cached = _frames.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached
+    # Loaded outside the lock so other sessions, status and evict are not blocked meanwhile
+    df = load_dataset(path)
+    with _cache_lock:
+        cached = _frames.get(path)
+        if cached is None or cached[0] != fingerprint:
+            _frames[path] = (fingerprint, df)
+        return _frames[path]
+
+
+def get_agent(path: str, session: str):
+    """Return the warm agent for (`path`, `session`), creating it if needed."""
+    from agent import EDAAgent
+
+    fingerprint, df = get_dataframe(path)
+    with _cache_lock:
+        cached = _agents.get((path, session))
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    # Built outside the lock: with USE_KERNEL this also writes the Arrow copy and starts a process
+    agent = EDAAgent(dataframe=df)
+    stale = []
+    with _cache_lock:
+        cached = _agents.get((path, session))
+        if cached is not None and cached[0] == fingerprint:
+            # Another request for this session finished building first; keep its agent
+            stale.append(agent)
+            agent = cached[1]
+        else:
+            if cached is not None:
+                stale.append(cached[1])
+            _agents[(path, session)] = (fingerprint, agent)
+    close_agents(stale)
+    return agent
+
+
+def close_agents(agents: list):
+    """Release agents dropped from the cache (with USE_KERNEL each holds a worker process)."""
+    # Waiting for the run lock ensures an agent is never closed in the middle of a run.
+    with _run_lock:
+        for agent in agents:
+            agent.close()
+
+
+def require_path(request: dict) -> str:
+    path = request.get("path")
+    if not path:
+        raise ValueError(f"The '{request.get('action', 'ask')}' action requires a dataset 'path'")
+    return path
+
+
+class EDARequestHandler(socketserver.StreamRequestHandler):
+    def send(self, message: dict):
+        self.wfile.write((json.dumps(message, default=str) + "\n").encode())
+        self.wfile.flush()
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            action = request.get("action", "ask")
+            if action == "ask":
+                self.handle_ask(request)
+            elif action == "status":
+                with _cache_lock:
+                    self.send({"type": "result", "content": {
+                        "frames": {path: list(df.shape) for path, (_, df) in _frames.items()},
+                        "sessions": [f"{path}:{session}" for path, session in _agents],
+                    }})
+            elif action == "evict":
+                path = require_path(request)
+                with _cache_lock:
+                    _frames.pop(path, None)
+                    evicted = [_agents.pop(k)[1] for k in list(_agents) if k[0] == path]
+                close_agents(evicted)
+                self.send({"type": "result", "content": f"Evicted {path}"})
+            elif action == "shutdown":
+                self.send({"type": "result", "content": "Shutting down"})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                self.send({"type": "error", "content": f"Unknown action: {action}"})
+        except BrokenPipeError:
+            pass
+        except Exception as e:
+            self.send({"type": "error", "content": str(e)})
+
+    def handle_ask(self, request: dict):
+        from agent import describe_step
+
+        agent = get_agent(require_path(request), request.get("session", "default"))
+        if _run_lock.locked():
+            self.send({"type": "status", "content": "Waiting for the running analysis to finish"})
+        with _run_lock:
+            self.send({"type": "status", "content": "Running"})
+            for step in agent.run(request.get("query"), reset=request.get("reset", False), stream=True):
+                message = describe_step(step)
+                if message is not None:
+                    self.send(message)
+
+
+class EDADaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def warm_up(preload: list):
+    """Import the heavy libraries up front and load any datasets given on the command line."""
+    import pandas, matplotlib.pyplot, seaborn, smolagents, PIL  # noqa: F401
+    import agent, tools.eda_tools, tools.vision_tools, tools.file_io  # noqa: F401
+    for path in preload:
+        get_dataframe(os.path.abspath(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm EDA agent daemon")
+    parser.add_argument("--socket", type=str, default=config.DAEMON_SOCKET_PATH, help="Unix socket path")
+    parser.add_argument("--preload", nargs="*", default=[], help="Datasets to load at startup")
+    args = parser.parse_args()
+
+    warm_up(args.preload)
+    if os.path.exists(args.socket):
+        os.remove(args.socket)
+    with EDADaemon(args.socket, EDARequestHandler) as server:
+        print(f"EDA daemon listening on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            close_agents([agent for _, agent in _agents.values()])
+            os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()
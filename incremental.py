@@ -0,0 +1,207 @@
+"""
+Incremental re-analysis for datasets that grow by appending rows or files.
+
+Mergeable per-column aggregates (numeric moments, histogram bins, category
+counts) are persisted between runs. Each run reads only the new data, folds it
+into the aggregates, re-renders plots whose distribution shifted materially and
+refreshes the incremental section of the existing report.
+"""
+import datetime
+import glob
+import io
+import json
+import os
+
+import pandas as pd
+
+import config
+from tools.column_stats import distribution_shift, new_column_stats, stats_from_dict
+from tools.eda_tools import ensure_directory
+from tools.plotting import plot_filename
+
+VISUALIZATION_DIR = "output/visualizations/incremental"
+REPORT_START_MARKER = "<!-- incremental-update:start -->"
+REPORT_END_MARKER = "<!-- incremental-update:end -->"
+
+
+def load_state(state_path: str) -> dict:
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path) as f:
+        return json.load(f)
+
+
+def save_state(state: dict, state_path: str):
+    ensure_directory(os.path.dirname(state_path) or ".")
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def read_new_data(path: str, source: dict) -> pd.DataFrame:
+    """
+    Read only the data that was not seen by the previous run and update `source` in place.
+
+    CSV files are read from the byte offset where the last run stopped, up to the last complete
+    line. For Parquet, `path`
+    may be a single file or a directory; row counts come from the file footers, so unchanged
+    files are not read, unseen files are read in full and grown files only from the first
+    row group holding new rows.
+    """
+    if path.endswith(".csv"):
+        size = os.path.getsize(path)
+        offset = source.get("offset", 0)
+        if size < offset:
+            raise ValueError(f"{path} shrank since the last run; delete the incremental state to rebuild.")
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # A writer may be mid-append: only consume complete lines and leave the rest for the next run
+        data = data[:data.rfind(b"\n") + 1]
+        source["offset"] = offset + len(data)
+        if not data.strip():
+            return pd.DataFrame(columns=source.get("columns", []))
+        if offset == 0:
+            frame = pd.read_csv(io.BytesIO(data))
+            # The header is only seen on the first read that has data, so remember it for later runs
+            source["columns"] = [str(c) for c in frame.columns]
+            return frame
+        return pd.read_csv(io.BytesIO(data), header=None, names=source["columns"])
+
+    if os.path.isdir(path):
+        files = sorted(glob.glob(os.path.join(path, "*.parquet")))
+    elif path.endswith(".parquet"):
+        files = [path]
+    else:
+        raise ValueError("Unsupported file format. Please provide .csv, .parquet or a directory of .parquet files.")
+
+    import pyarrow.parquet as pq
+
+    seen = source.setdefault("files", {})
+    frames = []
+    for file_path in files:
+        read_rows = seen.get(file_path, 0)
+        parquet_file = pq.ParquetFile(file_path)
+        num_rows = parquet_file.metadata.num_rows  # Footer only; unchanged files are not read
+        if num_rows > read_rows:
+            # Skip the row groups that were fully read by earlier runs
+            first_row, group_start, groups = 0, 0, []
+            for i in range(parquet_file.num_row_groups):
+                group_end = group_start + parquet_file.metadata.row_group(i).num_rows
+                if group_end > read_rows:
+                    groups.append(i)
+                else:
+                    first_row = group_end
+                group_start = group_end
+            frame = parquet_file.read_row_groups(groups).to_pandas()
+            frames.append(frame.iloc[read_rows - first_row:])
+        seen[file_path] = num_rows
+    if not frames:
+        return pd.DataFrame(columns=source.get("columns", []))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _render_report_section(state: dict, new_rows: int) -> str:
+    lines = [
+        REPORT_START_MARKER,
+        "## Incremental Update",
+        "",
+        f"Last refreshed: {datetime.datetime.now().isoformat(timespec='seconds')} "
+        f"({state['source']['rows']} rows total, {new_rows} new).",
+        "",
+        "| Column | Summary |",
+        "| --- | --- |",
+    ]
+    columns = {name: stats_from_dict(data) for name, data in state["columns"].items()}
+    lines += [f"| {name} | {stats.summary()} |" for name, stats in columns.items()]
+    for name, plot in state.get("plots", {}).items():
+        lines += ["", f"### {name}", "", f"![{name}]({plot['path'].replace('output/', '')})"]
+        if plot.get("analysis"):
+            lines += ["", plot["analysis"]]
+    lines.append(REPORT_END_MARKER)
+    return "\n".join(lines)
+
+
+def refresh_report(section: str, report_path: str):
+    """Replace the incremental section of the report, appending it if not present yet."""
+    if os.path.exists(report_path):
+        with open(report_path) as f:
+            report = f.read()
+    else:
+        report = "# Exploratory Data Analysis Report\n"
+
+    start, end = report.find(REPORT_START_MARKER), report.find(REPORT_END_MARKER)
+    if start != -1 and end != -1:
+        report = report[:start] + section + report[end + len(REPORT_END_MARKER):]
+    else:
+        report = report.rstrip("\n") + "\n\n" + section + "\n"
+
+    ensure_directory(os.path.dirname(report_path) or ".")
+    with open(report_path, "w") as f:
+        f.write(report)
+
+
+def run_incremental(path: str, state_path: str = config.INCREMENTAL_STATE_PATH,
+                    report_path: str = "output/report.md", analyze: bool = True) -> str:
+    """
+    Update the stored aggregates with new data from `path` and refresh changed plots and the report.
+
+    Args:
+        path: Path to the growing dataset (CSV, Parquet file or directory of Parquet files).
+        state_path: Where the aggregates from previous runs are stored.
+        report_path: The markdown report to refresh.
+        analyze: Whether to run the vision model on re-rendered plots.
+
+    Returns:
+        A short summary of what was updated.
+    """
+    state = load_state(state_path)
+    if state.get("source", {}).get("path") != path:
+        state = {"source": {"path": path, "rows": 0}, "columns": {}, "plots": {}}
+    source = state["source"]
+
+    new_data = read_new_data(path, source)
+    if not source.get("columns") and len(new_data.columns):
+        source["columns"] = [str(c) for c in new_data.columns]
+    if new_data.empty:
+        save_state(state, state_path)
+        return f"No new rows in {path}; report left unchanged."
+    source["rows"] += len(new_data)
+
+    columns = {name: stats_from_dict(data) for name, data in state["columns"].items()}
+    for column in new_data.columns:
+        name = str(column)
+        if name not in columns:
+            columns[name] = new_column_stats(new_data[column])
+        columns[name].update(new_data[column])
+
+    changed = []
+    ensure_directory(VISUALIZATION_DIR)
+    for name, stats in columns.items():
+        if stats.count == 0 or getattr(stats, "high_cardinality", False):
+            continue
+        current = stats.distribution()
+        if stats.rendered is not None and distribution_shift(stats.rendered, current) < config.MATERIAL_CHANGE_THRESHOLD:
+            continue
+        plot_path = os.path.join(VISUALIZATION_DIR, plot_filename(name, stats.kind))
+        with open(plot_path, "wb") as f:
+            f.write(stats.render(name).getvalue())
+        stats.rendered = current
+        plot = {"path": plot_path, "analysis": None}
+        if analyze:
+            from tools.vision_tools import analyze_image
+            plot["analysis"] = analyze_image(
+                image_path=plot_path,
+                query=f"Describe the key patterns in this plot of the '{name}' column in a few sentences.",
+            )
+        state["plots"][name] = plot
+        changed.append(name)
+
+    state["columns"] = {name: stats.to_dict() for name, stats in columns.items()}
+    refresh_report(_render_report_section(state, len(new_data)), report_path)
+    save_state(state, state_path)
+
+    changed_str = ", ".join(changed) if changed else "none"
+    return (f"Processed {len(new_data)} new rows ({source['rows']} total). "
+            f"Re-rendered plots: {changed_str}. Report refreshed at {report_path}.")
@@ -0,0 +1,175 @@
+"""
+Asynchronous interactive session for the EDA agent.
+
+Agent steps, new plots and report updates are printed as they are produced.
+Questions typed while a run is in progress are queued and run in order.
+Ctrl-C cancels the current run: the agent stops before its next step and keeps
+its memory, the DataFrame and (with the execution kernel) the kernel variables.
+With the kernel enabled, a second Ctrl-C kills the running code step at once;
+this restarts the kernel, which resets state['df'] and loses its variables.
+Ctrl-C while idle, 'exit' or EOF ends the session.
+"""
+import asyncio
+import os
+import signal
+import sys
+
+from agent import describe_step
+
+REPORT_PATH = "output/report.md"
+REPORT_PREVIEW_LINES = 20
+
+
+def _report_mtime():
+    return os.path.getmtime(REPORT_PATH) if os.path.exists(REPORT_PATH) else None
+
+
+class InteractiveSession:
+    def __init__(self, agent):
+        self.agent = agent
+        self.queries = asyncio.Queue()
+        self.running = False
+        self.cancelled = False
+        self.finished = asyncio.Event()
+        self._stdin_buffer = b""
+
+    def _on_stdin_ready(self):
+        # stdin is read from the event loop instead of a blocking input() thread: a thread left
+        # inside input() at exit can abort interpreter shutdown while it holds the stdin buffer.
+        data = os.read(sys.stdin.fileno(), 4096)
+        if not data:
+            self._on_line(None)
+            return
+        self._stdin_buffer += data
+        while b"\n" in self._stdin_buffer:
+            line, self._stdin_buffer = self._stdin_buffer.split(b"\n", 1)
+            self._on_line(line.decode(errors="replace"))
+
+    def _on_line(self, line):
+        if self.finished.is_set():
+            return
+        if line is None or line.strip().lower() == "exit":
+            asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+            if self.running:
+                # The session is ending, so there is no kernel state left to preserve
+                self.cancelled = True
+                self.agent.interrupt(kill_step=True)
+            self.finished.set()
+            return
+        if not line.strip():
+            return
+        self.queries.put_nowait(line)
+        if self.running:
+            print(f"[queued: {self.queries.qsize()} question(s) waiting]")
+
+    def _on_sigint(self):
+        if not self.running:
+            self.finished.set()
+        elif not self.cancelled:
+            self.cancelled = True
+            self.agent.interrupt()
+            if self.agent.use_kernel:
+                print("\n[cancelling after the current step; press Ctrl-C again to kill it now, "
+                      "which restarts the execution kernel and loses its variables]")
+            else:
+                print("\n[cancelling after the current step...]")
+        elif self.agent.use_kernel:
+            print("\n[killing the running code step; the execution kernel restarts, so state['df'] "
+                  "is reset and variables from earlier steps are lost]")
+            self.agent.interrupt(kill_step=True)
+
+    def _print_prompt(self):
+        if self.queries.empty():
+            print("\nWhat would you like to know about the data? > ", end="", flush=True)
+
+    def _print_event(self, step):
+        message = describe_step(step)
+        if message is None:
+            return
+        if message["type"] == "plan":
+            print("\n--- Plan ---")
+            print(message["content"])
+        elif message["type"] == "step":
+            print(f"\n--- Step {message['step']} ---")
+            if message["observations"]:
+                print(message["observations"])
+            if message["error"]:
+                print(f"Error: {message['error']}")
+        elif message["type"] == "result":
+            print("\nAgent Response:")
+            print(message["content"])
+
+    async def _run_query(self, query: str):
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def emit(kind, payload=None):
+            loop.call_soon_threadsafe(events.put_nowait, (kind, payload))
+
+        def drive():
+            try:
+                for step in self.agent.run(query, reset=False, stream=True):
+                    emit("step", step)
+            except Exception as e:
+                emit("error", e)
+            finally:
+                emit("done")
+
+        self.running, self.cancelled = True, False
+        shown_plots, report_mtime = 0, _report_mtime()
+        worker = loop.run_in_executor(None, drive)
+        try:
+            while True:
+                kind, payload = await events.get()
+                if kind == "done":
+                    break
+                if kind == "error":
+                    print("\n[run cancelled]" if self.cancelled else f"\nError: {payload}")
+                    continue
+                self._print_event(payload)
+
+                plots = self.agent.current_state.get("visualization_paths", [])
+                for path in plots[shown_plots:]:
+                    print(f"[plot saved] {path}")
+                shown_plots = len(plots)
+
+                if _report_mtime() != report_mtime:
+                    report_mtime = _report_mtime()
+                    with open(REPORT_PATH) as f:
+                        preview = f.read().splitlines()[:REPORT_PREVIEW_LINES]
+                    print(f"[report updated] {REPORT_PATH}")
+                    print("\n".join(preview))
+        finally:
+            await worker
+            self.running = False
+
+    async def _process_queries(self):
+        while True:
+            self._print_prompt()
+            query = await self.queries.get()
+            await self._run_query(query)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, self._on_sigint)
+        loop.add_reader(sys.stdin.fileno(), self._on_stdin_ready)
+
+        print("\nEntering interactive mode. Type 'exit' to quit.")
+        print("You can ask questions about the data or request specific analyses.")
+        print("Questions asked during a run are queued; press Ctrl-C to cancel the current run.")
+
+        processor = asyncio.create_task(self._process_queries())
+        await self.finished.wait()
+        # Let an interrupted run wind down so the agent memory is recorded
+        processor.cancel()
+        try:
+            await processor
+        except asyncio.CancelledError:
+            pass
+        loop.remove_reader(sys.stdin.fileno())
+        loop.remove_signal_handler(signal.SIGINT)
+
+
+def run_interactive(agent):
+    """Run the streaming interactive loop until the user exits."""
+    asyncio.run(InteractiveSession(agent).run())
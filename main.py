@@ -1,38 +1,46 @@
 import argparse
-from agent import EDAAgent
-from tools.file_io import load_csv, load_parquet
+import json
+import config
 
 def main():
     parser = argparse.ArgumentParser(description="Autonomous EDA Agent")
     parser.add_argument("--path", type=str, help="Path to the dataset (CSV/Parquet)")
     parser.add_argument("--interactive", action="store_true", help="Run in interactive mode")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only process rows/files appended since the last run and refresh output/report.md")
+    parser.add_argument("--batch", action="store_true",
+                        help="Treat --path as a directory or glob and process every dataset in it")
+    parser.add_argument("--cpu-workers", type=int, default=config.BATCH_CPU_WORKERS,
+                        help="Batch mode: processes for loading, profiling and rendering")
+    parser.add_argument("--llm-workers", type=int, default=config.BATCH_LLM_WORKERS,
+                        help="Batch mode: concurrent agent runs (0 to only profile)")
+    parser.add_argument("--kernel", action="store_true", default=config.USE_KERNEL,
+                        help="Run generated code in a persistent, resource-limited worker process")
     args = parser.parse_args()
 
-    if args.path.endswith(".csv"):
-        df = load_csv(args.path)
-    elif args.path.endswith(".parquet"):
-        df = load_parquet(args.path)
-    else:
-        raise ValueError("Unsupported file format. Please provide .csv or .parquet.")
+    if args.batch:
+        from batch import run_batch
+        summary = run_batch(args.path, cpu_workers=args.cpu_workers, llm_workers=args.llm_workers)
+        print(json.dumps(summary, indent=2))
+        return
+
+    if args.incremental:
+        from incremental import run_incremental
+        print(run_incremental(args.path))
+        return
+
+    # Imported here so --help and the batch/incremental modes skip the agent stack
+    from agent import EDAAgent
+    from tools.file_io import load_dataset
+
+    df = load_dataset(args.path)
 
-    # Create the EDA agent
-    agent = EDAAgent(dataframe=df)
+    # Create the EDA agent; interactive mode prints the streamed steps itself
+    agent = EDAAgent(dataframe=df, use_kernel=args.kernel, verbose=not args.interactive)
     
     if args.interactive:
-        print("\nEntering interactive mode. Type 'exit' to quit.")
-        print("You can ask questions about the data or request specific analyses.")
-        
-        while True:
-            query = input("\nWhat would you like to know about the data? > ")
-            if query.lower() == 'exit':
-                break
-                
-            try:
-                result = agent.ask(query)
-                print("\nAgent Response:")
-                print(result)
-            except Exception as e:
-                print(f"\nError: {str(e)}")
+        from interactive import run_interactive
+        run_interactive(agent)
     else:
         # Run default analysis
 
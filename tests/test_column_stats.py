@@ -0,0 +1,44 @@
+"""
+test_column_stats.py
+
+Regression tests for the mergeable per-column aggregates in tools/column_stats.py.
+"""
+import numpy as np
+import pandas as pd
+
+from tools.column_stats import NumericStats, stats_from_dict
+
+
+def test_first_batch_edges_span_exact_range():
+    stats = NumericStats()
+    stats.update(pd.Series([0.1, 0.7, 1.3, 2.9]))
+    assert stats.edges[0] == 0.1
+    assert stats.edges[-1] == 2.9
+
+
+def test_first_batch_matches_numpy_histogram():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        values = rng.normal(rng.uniform(-1e4, 1e4), rng.uniform(1, 1e4), size=50)
+        stats = NumericStats()
+        stats.update(pd.Series(values))
+        assert stats.edges[-1] == values.max()
+        counts, _ = np.histogram(values, bins=stats.edges)
+        assert stats.bins == counts.tolist()
+
+
+def test_growing_range_keeps_every_count():
+    stats = NumericStats()
+    stats.update(pd.Series([-1952.0, 1062.0]))
+    stats.update(pd.Series([-5000.0, 9000.0, 0.0]))
+    assert stats.edges[0] <= -5000.0 and stats.edges[-1] >= 9000.0
+    assert sum(stats.bins) == 5
+    assert stats.count == 5 and stats.min == -5000.0 and stats.max == 9000.0
+
+
+def test_round_trip_through_dict():
+    stats = NumericStats()
+    stats.update(pd.Series([1.0, 2.0, 3.0]))
+    restored = stats_from_dict(stats.to_dict())
+    restored.update(pd.Series([4.0]))
+    assert restored.count == 4 and sum(restored.bins) == 4
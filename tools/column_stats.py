@@ -0,0 +1,170 @@
+"""
+Mergeable per-column aggregates used for incremental and batch profiling.
+
+Numeric columns keep streaming moments and a histogram whose bins can grow without
+losing counts; categorical columns keep value counts. Aggregates from separate
+batches of rows can be folded together and serialized to plain dicts.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+import config
+from tools.plotting import plot_histogram_from_bins, plot_category_counts
+
+
+class NumericStats:
+    """Count, mean, variance, range and mergeable histogram of a numeric column."""
+
+    kind = "numeric"
+
+    def __init__(self, count=0, nulls=0, mean=0.0, m2=0.0, min=None, max=None,
+                 edges=None, bins=None, rendered=None):
+        self.count = count
+        self.nulls = nulls
+        self.mean = mean
+        self.m2 = m2
+        self.min = min
+        self.max = max
+        self.edges = edges
+        self.bins = bins
+        self.rendered = rendered
+
+    def update(self, series: pd.Series):
+        """Fold a batch of values into the aggregates."""
+        values = pd.to_numeric(series, errors="coerce")
+        self.nulls += int(values.isna().sum())
+        values = values.dropna().to_numpy(dtype=float)
+        if len(values) == 0:
+            return
+
+        # Chan et al. parallel merge of mean and sum of squared deviations
+        n, batch_mean = len(values), float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.m2 += batch_m2 + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+
+        batch_min, batch_max = float(values.min()), float(values.max())
+        self.min = batch_min if self.min is None else min(self.min, batch_min)
+        self.max = batch_max if self.max is None else max(self.max, batch_max)
+
+        if self.edges is None:
+            self._init_bins(batch_min, batch_max)
+        self._extend_bins(batch_min, batch_max)
+        counts, _ = np.histogram(values, bins=self.edges)
+        self.bins = [a + int(b) for a, b in zip(self.bins, counts)]
+
+    def _init_bins(self, low: float, high: float):
+        # An even number of bins lets the range double to either side while every pair
+        # of old bins merges into exactly one new bin, so counts stay mergeable.
+        n_bins = config.HISTOGRAM_BINS + config.HISTOGRAM_BINS % 2
+        # linspace pins the last edge to `high` exactly; low + width * n_bins can round below it
+        self.edges = np.linspace(low, high if high > low else low + n_bins, n_bins + 1).tolist()
+        self.bins = [0] * n_bins
+
+    def _extend_bins(self, low: float, high: float):
+        """Double the bin width (growing the range left or right) until [low, high] is covered."""
+        n_bins = len(self.bins)
+        start, end = self.edges[0], self.edges[-1]
+        if start <= low and high <= end:
+            return
+        while low < start or high > end:
+            # Growing left prepends n_bins old-width bins of padding before pairing bins up
+            offset = n_bins if low < start else 0
+            merged = [0] * n_bins
+            for i, count in enumerate(self.bins):
+                merged[(i + offset) // 2] += count
+            span = end - start
+            start, end = (start - span, end) if offset else (start, end + span)
+            self.bins = merged
+        self.edges = np.linspace(start, end, n_bins + 1).tolist()
+
+    @property
+    def std(self):
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+    def distribution(self):
+        # Keyed by left edge so a distribution is comparable across bin-width changes
+        return {f"{edge:.12g}": count for edge, count in zip(self.edges or [], self.bins or [])}
+
+    def summary(self):
+        if self.count == 0:
+            return f"count=0, missing={self.nulls}"
+        return (f"count={self.count}, missing={self.nulls}, mean={self.mean:.4g}, "
+                f"std={self.std:.4g}, min={self.min:.4g}, max={self.max:.4g}")
+
+    def render(self, column: str) -> io.BytesIO:
+        return plot_histogram_from_bins(self.edges, self.bins,
+                                        title=f"Distribution of {column}", xlabel=column)
+
+    def to_dict(self):
+        return {"kind": self.kind, "count": self.count, "nulls": self.nulls, "mean": self.mean,
+                "m2": self.m2, "min": self.min, "max": self.max, "edges": self.edges,
+                "bins": self.bins, "rendered": self.rendered}
+
+
+class CategoricalStats:
+    """Value counts of a categorical column, dropped once cardinality gets too high."""
+
+    kind = "categorical"
+
+    def __init__(self, count=0, nulls=0, counts=None, high_cardinality=False, rendered=None):
+        self.count = count
+        self.nulls = nulls
+        self.counts = counts if counts is not None else {}
+        self.high_cardinality = high_cardinality
+        self.rendered = rendered
+
+    def update(self, series: pd.Series):
+        """Fold a batch of values into the aggregates."""
+        self.nulls += int(series.isna().sum())
+        values = series.dropna()
+        self.count += len(values)
+        if self.high_cardinality:
+            return
+        for value, count in values.astype(str).value_counts().items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+        if len(self.counts) > config.MAX_TRACKED_CATEGORIES:
+            self.high_cardinality = True
+            self.counts = {}
+
+    def distribution(self):
+        return dict(self.counts)
+
+    def summary(self):
+        if self.high_cardinality:
+            return f"count={self.count}, missing={self.nulls}, high cardinality"
+        top = max(self.counts.items(), key=lambda item: item[1], default=None)
+        top_str = f", top={top[0]} ({top[1]})" if top else ""
+        return f"count={self.count}, missing={self.nulls}, unique={len(self.counts)}{top_str}"
+
+    def render(self, column: str) -> io.BytesIO:
+        return plot_category_counts(self.counts, title=f"Counts of {column}", xlabel=column)
+
+    def to_dict(self):
+        return {"kind": self.kind, "count": self.count, "nulls": self.nulls, "counts": self.counts,
+                "high_cardinality": self.high_cardinality, "rendered": self.rendered}
+
+
+def stats_from_dict(data: dict):
+    data = dict(data)
+    kind = data.pop("kind")
+    return NumericStats(**data) if kind == NumericStats.kind else CategoricalStats(**data)
+
+
+def distribution_shift(old: dict, new: dict) -> float:
+    """Total variation distance between two count distributions (1.0 if either is empty)."""
+    old_total, new_total = sum(old.values()), sum(new.values())
+    if old_total == 0 or new_total == 0:
+        return 1.0
+    keys = set(old) | set(new)
+    return 0.5 * sum(abs(old.get(k, 0) / old_total - new.get(k, 0) / new_total) for k in keys)
+
+
+def new_column_stats(series: pd.Series):
+    """Create empty aggregates of the right kind for `series`."""
+    return NumericStats() if pd.api.types.is_numeric_dtype(series) else CategoricalStats()
@@ -1,5 +1,4 @@
 import pandas as pd
-from tools.plotting import plot_histogram, plot_pie, plot_scatter, plot_line, plot_boxplot, plot_bar
 from smolagents import tool
 import os
 import io
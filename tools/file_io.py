@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 
 def load_csv(file_path: str) -> pd.DataFrame:
@@ -6,3 +7,14 @@ def load_csv(file_path: str) -> pd.DataFrame:
 def load_parquet(file_path: str) -> pd.DataFrame:
     return pd.read_parquet(file_path)
 
+def load_dataset(file_path: str) -> pd.DataFrame:
+    if file_path.endswith(".csv"):
+        return load_csv(file_path)
+    if file_path.endswith(".parquet"):
+        return load_parquet(file_path)
+    raise ValueError("Unsupported file format. Please provide .csv or .parquet.")
+
+def file_fingerprint(file_path: str) -> str:
+    """Cheap change marker for a file: its size and modification time."""
+    stat = os.stat(file_path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
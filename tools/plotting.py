@@ -1,10 +1,26 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
 import io
+import re
 
 # Set a default theme for consistent styling and improved aesthetics
 sns.set_theme(style="whitegrid", context="talk", palette="deep")
 
+def plot_filename(column, kind):
+    """
+    Builds a filesystem-safe PNG file name for a per-column plot.
+    
+    Args:
+        column (str): Column name the plot shows.
+        kind (str): "numeric" for histograms, anything else for category counts.
+        
+    Returns:
+        str: File name such as "price_hist.png".
+    """
+    safe_name = re.sub(r"[^0-9A-Za-z_-]+", "_", str(column))
+    suffix = "hist" if kind == "numeric" else "counts"
+    return f"{safe_name}_{suffix}.png"
+
 def _save_plot():
     """
     Helper function to save the current matplotlib figure to a BytesIO buffer.
@@ -183,3 +199,51 @@ def plot_pie(df, column, title="Pie Chart"):
     plt.ylabel('')  # Remove the ylabel for a cleaner look
     return _save_plot()
 
+
+def plot_histogram_from_bins(edges, counts, title="Histogram", xlabel=None, ylabel="Frequency"):
+    """
+    Plots a histogram from pre-aggregated bin edges and counts.
+    
+    Args:
+        edges (list): Bin edges (one more than the number of counts).
+        counts (list): Number of values falling into each bin.
+        title (str): Title of the plot.
+        xlabel (str): Label for the x-axis.
+        ylabel (str): Label for the y-axis.
+        
+    Returns:
+        BytesIO: Buffer containing the plot image.
+    """
+    plt.figure(figsize=(12, 8))
+    plt.stairs(counts, edges, fill=True, alpha=0.8)
+    if title:
+        plt.title(title)
+    if xlabel:
+        plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    return _save_plot()
+
+def plot_category_counts(counts, title="Category Counts", xlabel=None, ylabel="Count", top_n=20):
+    """
+    Plots a bar chart from pre-aggregated category counts.
+    
+    Args:
+        counts (dict): Mapping of category value to its count.
+        title (str): Title of the plot.
+        xlabel (str): Label for the x-axis.
+        ylabel (str): Label for the y-axis.
+        top_n (int): Number of most frequent categories to show.
+        
+    Returns:
+        BytesIO: Buffer containing the plot image.
+    """
+    top = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:top_n]
+    plt.figure(figsize=(12, 8))
+    sns.barplot(x=[str(k) for k, _ in top], y=[v for _, v in top])
+    plt.xticks(rotation=45, ha="right")
+    if title:
+        plt.title(title)
+    if xlabel:
+        plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    return _save_plot()
@@ -0,0 +1,320 @@
+"""
+Out-of-process execution kernel for agent code.
+
+The DataFrame is written once to an Arrow IPC file in shared memory (or a
+pickle, for frames Arrow cannot represent) and loaded by a persistent worker
+process, which also holds the plotting stack and all variables created by
+agent code. Each step runs under CPU, memory and wall-clock limits; a runaway
+step kills the worker, which is restarted from the shared-memory copy without
+reloading the source data.
+"""
+import multiprocessing
+import os
+import pickle
+import signal
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+import config
+
+try:
+    from smolagents.local_python_executor import CodeOutput, InterpreterError, PythonExecutor
+except ImportError:  # Older smolagents releases return plain tuples from executors
+    CodeOutput = None
+    InterpreterError = ValueError
+    PythonExecutor = object
+
+RESTART_NOTE = ("state['df'] was reset to the original dataset, so redo any cleaning you applied to it, "
+                "and variables and handles from earlier steps were lost.")
+
+# Objects that live in the kernel's `state` and must never be shipped from the parent
+RESIDENT_STATE_KEYS = ("df", "pd", "np", "plt", "sns", "io", "handles")
+
+
+class KernelHandle:
+    """Reference to a large object kept inside the kernel until the end of the current run."""
+
+    def __init__(self, handle_id: str, type_name: str, shape, preview: str):
+        self.handle_id = handle_id
+        self.type_name = type_name
+        self.shape = shape
+        self.preview = preview
+
+    def __repr__(self):
+        shape = f", shape={self.shape}" if self.shape is not None else ""
+        return (f"<{self.type_name}{shape} kept in kernel as state['handles']['{self.handle_id}'] "
+                "until the end of this run>\n"
+                f"{self.preview}")
+
+
+def _shared_memory_dir():
+    return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _resolve_tools(names: list) -> dict:
+    """Map tool names sent by the parent to the tool objects importable in the kernel."""
+    from smolagents.default_tools import FinalAnswerTool
+    from agent import eda_tools
+
+    available = {t.name: t for t in eda_tools() + [FinalAnswerTool()]}
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"Tools not available in the execution kernel: {', '.join(unknown)}. "
+                         "Add them to agent.eda_tools() to use them with the kernel.")
+    return {name: available[name] for name in names}
+
+
+def _estimate_size(value) -> int:
+    """In-memory size of `value`, cheap enough to check before deciding whether to pickle it."""
+    import pandas as pd
+
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)  # One value per column for a DataFrame
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    nbytes = getattr(value, "nbytes", None)  # numpy arrays
+    return nbytes if isinstance(nbytes, int) else sys.getsizeof(value)
+
+
+def _to_transferable(value, handles: dict):
+    """Return `value` if it is small and picklable, otherwise a KernelHandle to it."""
+    # Measure before pickling so large outputs are never copied just to learn their size
+    if _estimate_size(value) <= config.KERNEL_HANDLE_THRESHOLD_BYTES:
+        try:
+            # sys.getsizeof does not count nested objects, so the pickled size is checked too
+            if len(pickle.dumps(value)) <= config.KERNEL_HANDLE_THRESHOLD_BYTES:
+                return value
+        except Exception:
+            pass
+    handle_id = f"h{len(handles) + 1}"
+    handles[handle_id] = value
+    preview = value.head().to_string() if hasattr(value, "head") else repr(value)[:1000]
+    return KernelHandle(handle_id, type(value).__name__, getattr(value, "shape", None), preview)
+
+
+def _set_step_limits(resource):
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_used = int(usage.ru_utime + usage.ru_stime)
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_used + config.KERNEL_STEP_CPU_SECONDS, cpu_hard))
+
+    with open("/proc/self/statm") as f:
+        address_space = int(f.read().split()[0]) * resource.getpagesize()
+    _, as_hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (address_space + config.KERNEL_STEP_MEMORY_MB * 1024 ** 2, as_hard))
+
+
+def _kernel_main(conn, data_path: str, authorized_imports: list):
+    """Worker loop: load the shared DataFrame, then execute code snippets on request."""
+    import io
+    import resource
+
+    # Ctrl-C in the terminal reaches the whole process group; the parent decides what to cancel.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import seaborn as sns
+    from smolagents.local_python_executor import LocalPythonExecutor
+
+    plt.style.use(config.PLOT_STYLE)
+    plt.rcParams['figure.figsize'] = config.FIGURE_SIZE
+    plt.rcParams['figure.dpi'] = config.DPI
+
+    def load_frame():
+        if data_path.endswith(".pkl"):
+            return pd.read_pickle(data_path)
+        with pa.memory_map(data_path) as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    # Like the in-process executor's per-run copy, every run starts from the original data,
+    # so a restart (which also reloads it) never silently diverges from a normal run.
+    df_modified = False
+    state = {"df": load_frame(), "pd": pd, "np": np, "plt": plt, "sns": sns, "io": io,
+             "visualization_paths": [], "handles": {}}
+    executor = LocalPythonExecutor(additional_authorized_imports=authorized_imports)
+    executor.send_variables({"state": state})
+    conn.send(("ready",))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:  # The parent went away without sending "close"
+            break
+        kind = message[0]
+        if kind == "close":
+            break
+        if kind == "tools":
+            executor.send_tools(_resolve_tools(message[1]))
+        elif kind == "variables":
+            variables = dict(message[1])
+            state.update(variables.pop("state", {}))
+            # A new run starts: outputs kept as handles by the previous run are released
+            state["handles"].clear()
+            if df_modified:
+                state["df"], df_modified = load_frame(), False
+            executor.send_variables({**variables, "state": state})
+        elif kind == "exec":
+            df_modified = True
+            _set_step_limits(resource)
+            try:
+                result = executor(message[1])
+                output, logs, is_final_answer = (
+                    (result.output, result.logs, result.is_final_answer) if CodeOutput else result)
+                conn.send(("ok", _to_transferable(output, state["handles"]), logs,
+                           is_final_answer, list(state["visualization_paths"])))
+            except BaseException as e:
+                logs = str(executor.state.get("_print_outputs", ""))
+                conn.send(("error", f"{type(e).__name__}: {e}", logs, list(state["visualization_paths"])))
+
+
+class KernelPythonExecutor(PythonExecutor):
+    """
+    smolagents Python executor that runs agent code in a persistent worker process.
+
+    Args:
+        dataframe: The DataFrame to keep resident in the kernel as state['df'].
+        authorized_imports: Extra imports the agent code may use.
+    """
+
+    def __init__(self, dataframe, authorized_imports: list):
+        import pyarrow as pa
+
+        self.authorized_imports = authorized_imports
+        self.state = {}
+        self._tools = []
+        self._variables = {}
+        self._parent_state = None
+        self._process = None
+        self._interrupted = threading.Event()
+
+        try:
+            table = pa.Table.from_pandas(dataframe)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # e.g. object columns mixing numbers and strings; pickle keeps the values as they are
+            table = None
+
+        fd, self.data_path = tempfile.mkstemp(suffix=".arrow" if table is not None else ".pkl",
+                                              dir=_shared_memory_dir())
+        os.close(fd)
+        self._finalizer = weakref.finalize(self, _remove_file, self.data_path)
+        if table is not None:
+            with pa.OSFile(self.data_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            dataframe.to_pickle(self.data_path)
+        try:
+            self._start()
+        except Exception:
+            self._finalizer()
+            raise
+
+    def _start(self):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_kernel_main, daemon=True,
+                                        args=(child_conn, self.data_path, self.authorized_imports))
+        self._process.start()
+        child_conn.close()
+        try:
+            self._conn.recv()  # Wait until the DataFrame is mapped
+        except EOFError:
+            raise RuntimeError(f"Execution kernel failed to start (exit code {self._process.exitcode})")
+        if self._tools:
+            self._conn.send(("tools", self._tools))
+        if self._variables:
+            self._conn.send(("variables", self._variables))
+
+    def restart(self):
+        """Kill the worker and start a fresh one from the shared-memory DataFrame."""
+        if self._process is not None and self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self._start()
+
+    def send_tools(self, tools: dict):
+        # Fail in the parent, where the error reaches the caller, if the kernel cannot resolve a tool
+        _resolve_tools(list(tools))
+        self._tools = list(tools)
+        self._conn.send(("tools", self._tools))
+
+    def send_variables(self, variables: dict):
+        # Called at the start of every agent run, which also ends any earlier interruption
+        self._interrupted.clear()
+        variables = dict(variables)
+        if isinstance(variables.get("state"), dict):
+            self._parent_state = variables["state"]
+            variables["state"] = {k: v for k, v in self._parent_state.items() if k not in RESIDENT_STATE_KEYS}
+        self._variables = variables
+        self._conn.send(("variables", variables))
+
+    def _sync_visualization_paths(self, paths: list):
+        if self._parent_state is not None:
+            self._parent_state.setdefault("visualization_paths", [])[:] = paths
+
+    def interrupt(self):
+        """Kill the code step currently running, if any (safe to call from another thread)."""
+        self._interrupted.set()
+
+    def _wait_for_result(self):
+        deadline = time.monotonic() + config.KERNEL_STEP_TIMEOUT
+        while not self._conn.poll(0.1):
+            if self._interrupted.is_set():
+                self.restart()
+                raise InterpreterError(
+                    "Code step was cancelled. The kernel was restarted: "
+                    + RESTART_NOTE
+                )
+            if time.monotonic() > deadline:
+                self.restart()
+                raise InterpreterError(
+                    f"Code step exceeded the {config.KERNEL_STEP_TIMEOUT}s time limit. The kernel was restarted: "
+                    + RESTART_NOTE
+                )
+
+    def __call__(self, code_action: str):
+        self.state["_print_outputs"] = ""
+        self._conn.send(("exec", code_action))
+        self._wait_for_result()
+        try:
+            message = self._conn.recv()
+        except EOFError:
+            exitcode = self._process.exitcode
+            self.restart()
+            reason = "CPU time limit" if exitcode == -signal.SIGXCPU else "resource limits"
+            raise InterpreterError(
+                f"Code step was killed for exceeding {reason} (exit code {exitcode}). The kernel was restarted: "
+                + RESTART_NOTE
+            )
+
+        if message[0] == "error":
+            _, error, logs, paths = message
+            self.state["_print_outputs"] = logs
+            self._sync_visualization_paths(paths)
+            raise InterpreterError(error)
+
+        _, output, logs, is_final_answer, paths = message
+        self._sync_visualization_paths(paths)
+        if CodeOutput is None:
+            return output, logs, is_final_answer
+        return CodeOutput(output=output, logs=logs, is_final_answer=is_final_answer)
+
+    def cleanup(self):
+        """Stop the worker and release the shared-memory copy of the DataFrame."""
+        if self._process is not None and self._process.is_alive():
+            self._conn.send(("close",))
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.kill()
+        self._finalizer()
+
+
+def _remove_file(path: str):
+    if os.path.exists(path):
+        os.remove(path)
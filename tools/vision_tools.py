@@ -1,5 +1,4 @@
 from smolagents import tool, OpenAIServerModel
-from PIL import Image
 import io
 import base64
 
@@ -13,6 +12,8 @@ def analyze_image(image_path: str, query: str) -> str:
         query: The question or description you want to know about the image.
     """
     try:
+        from PIL import Image
+
         model = OpenAIServerModel(model_id="gpt-4o-mini")
 
         with open(image_path, "rb") as image_file: